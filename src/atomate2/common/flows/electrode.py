@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import copy
 import logging
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
@@ -157,6 +158,9 @@ class ElectrodeInsertionMaker(Maker, ABC):
     def get_charge_density(self, prev_dir: Path | str) -> VolumetricData:
         """Get the charge density of a structure.
 
+        This is called inside the insertion job, so the charge density is read
+        directly from the directory and never passed through the job store.
+
         Parameters
         ----------
         prev_dir:
@@ -175,9 +179,17 @@ class ElectrodeInsertionMaker(Maker, ABC):
 def _add_ignored_species(
     structure_matcher: StructureMatcher, species: ElementLike
 ) -> StructureMatcher:
-    """Add an ignored species to a structure matcher."""
-    sm_dict = structure_matcher.as_dict()
-    ignored_species = set(sm_dict.get("ignored_species", set()))
-    ignored_species.add(str(species))
-    sm_dict["ignored_species"] = list(ignored_species)
-    return StructureMatcher.from_dict(sm_dict)
+    """Add an ignored species to a structure matcher.
+
+    A shallow copy of the structure matcher is updated rather than round-tripping
+    it through ``as_dict``/``from_dict``.
+    """
+    ignored_species: list[str] = [
+        str(sp)
+        for sp in structure_matcher._ignored_species  # noqa: SLF001
+    ]
+    if str(species) not in ignored_species:
+        ignored_species.append(str(species))
+    new_matcher = copy.copy(structure_matcher)
+    new_matcher._ignored_species = ignored_species  # noqa: SLF001
+    return new_matcher
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 import numpy as np
@@ -101,8 +102,6 @@ def spawn_energy_curve_calcs(
     jobs = []
     outputs = []
 
-    # add the static job for the reference structure
-    static_maker.make(relaxed_structure)
     s_distortions = sorted(distortions)
     distorted_structures = relaxed_structure.interpolate(
         distorted_structure, nimages=s_distortions
@@ -219,11 +218,10 @@ def get_supercell_from_prv_calc(
     )
 
     if sc_mat_ref is not None:
-        latt_ref = (uc_structure * sc_mat_ref).lattice
-        latt_prv = (uc_structure * sc_mat_prv).lattice
-        if not (
-            np.allclose(sorted(latt_ref.abc), sorted(latt_prv.abc))
-            and np.allclose(sorted(latt_ref.angles), sorted(latt_prv.angles))
+        uc_matrix = uc_structure.lattice.matrix
+        if not np.allclose(
+            _get_sorted_lattice_params(uc_matrix, sc_mat_ref),
+            _get_sorted_lattice_params(uc_matrix, sc_mat_prv),
         ):
             raise ValueError(
                 "The supercell matrix extracted from the previous calculation "
@@ -273,7 +271,7 @@ def bulk_supercell_calculation(
             return task_doc.calcs_reversed[0].output.locpot
 
     logger.info("Running bulk supercell calculation. Running...")
-    sc_mat = get_sc_fromstruct(uc_structure) if sc_mat is None else sc_mat
+    sc_mat = _get_sc_fromstruct(uc_structure) if sc_mat is None else sc_mat
     sc_mat = np.array(sc_mat)
     sc_structure = uc_structure * sc_mat
     relax_job = relax_maker.make(sc_structure)
@@ -359,6 +357,14 @@ def spawn_defect_q_jobs(
         sc_def_struct.lattice = relaxed_sc_lattice
     if sc_mat is not None:
         sc_mat = np.array(sc_mat).tolist()
+    # provenance data shared by all charge states, the symmetry analysis in
+    # particular should only be done once
+    bulk_info = {
+        "bulk_formula": defect.structure.composition.reduced_formula,
+        "bulk_num_sites": len(defect.structure),
+        "bulk_space_group_info": defect.structure.get_space_group_info(),
+        "sc_mat": sc_mat,
+    }
     for qq in defect.get_charge_states():
         suffix = (
             f" {defect.name} q={qq}"
@@ -375,10 +381,7 @@ def spawn_defect_q_jobs(
             "defect": defect,
             "charge_state": qq,
             "defect_name": defect.name,
-            "bulk_formula": defect.structure.composition.reduced_formula,
-            "bulk_num_sites": len(defect.structure),
-            "bulk_space_group_info": defect.structure.get_space_group_info(),
-            "sc_mat": sc_mat,
+            **bulk_info,
         }
 
         if add_info is not None:
@@ -464,3 +467,69 @@ def get_defect_entry(charge_state_summary: dict, bulk_summary: dict) -> list[dic
             }
         )
     return defect_ent_res
+
+
+def _get_sorted_lattice_params(uc_matrix: NDArray, sc_mat: NDArray) -> NDArray:
+    """Get the sorted lengths and sorted angles of a supercell lattice.
+
+    Computed directly from the lattice matrices to avoid building the supercell.
+
+    Parameters
+    ----------
+    uc_matrix : NDArray
+        The unit cell lattice matrix.
+    sc_mat : NDArray
+        The supercell matrix, a scaling factor or three scaling factors are also
+        accepted as in ``Structure.__mul__``.
+
+    Returns
+    -------
+    NDArray
+        The sorted lattice lengths followed by the sorted lattice angles.
+    """
+    sc_mat = np.array(sc_mat, dtype=int)
+    if sc_mat.shape != (3, 3):
+        sc_mat = sc_mat * np.eye(3)
+    matrix = np.dot(sc_mat, uc_matrix)
+    abc = np.linalg.norm(matrix, axis=1)
+    unit = matrix / abc[:, None]
+    cosines = np.array([unit[1] @ unit[2], unit[0] @ unit[2], unit[0] @ unit[1]])
+    angles = np.degrees(np.arccos(np.clip(cosines, -1, 1)))
+    return np.concatenate([np.sort(abc), np.sort(angles)])
+
+
+def _get_sc_fromstruct(uc_structure: Structure) -> NDArray | None:
+    """Get a nearly-cubic supercell matrix for a unit cell.
+
+    The supercell search is deterministic but can take several seconds, so the
+    result is cached on the lattice, species and fractional coordinates. This lets
+    repeated calculations for the same host structure reuse the matrix.
+
+    Parameters
+    ----------
+    uc_structure : Structure
+        The unit cell structure.
+
+    Returns
+    -------
+    NDArray | None
+        The supercell matrix, or None if no suitable supercell was found.
+    """
+    sc_mat = _cached_sc_fromstruct(
+        uc_structure.lattice.matrix.tobytes(),
+        tuple(uc_structure.species_and_occu),
+        uc_structure.frac_coords.tobytes(),
+    )
+    # return a copy so the cached matrix cannot be modified
+    return None if sc_mat is None else np.array(sc_mat)
+
+
+@lru_cache(maxsize=64)
+def _cached_sc_fromstruct(
+    lattice_bytes: bytes, species: tuple, frac_coords_bytes: bytes
+) -> NDArray | None:
+    """Run the supercell search for a structure given in hashable form."""
+    lattice = np.frombuffer(lattice_bytes).reshape(3, 3)
+    frac_coords = np.frombuffer(frac_coords_bytes).reshape(-1, 3)
+    sc_mat = get_sc_fromstruct(Structure(lattice, species, frac_coords))
+    return None if sc_mat is None else np.asarray(sc_mat)
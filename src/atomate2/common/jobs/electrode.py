@@ -3,20 +3,29 @@
 from __future__ import annotations
 
 import logging
+from functools import cached_property
 from typing import TYPE_CHECKING, NamedTuple
 
+import numpy as np
 from emmet.core.electrode import InsertionElectrodeDoc
 from emmet.core.mpid import MPID
 from emmet.core.structure_group import StructureGroupDoc
 from jobflow import Flow, Maker, Response, job
 from pymatgen.analysis.defects.generators import ChargeInterstitialGenerator
+from pymatgen.analysis.defects.utils import (
+    ChargeInsertionAnalyzer,
+    get_labeled_inserted_structure,
+)
 from pymatgen.entries.computed_entries import ComputedStructureEntry
+from scipy.ndimage import minimum_filter
 from ulid import ULID
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Generator
     from pathlib import Path
 
+    from jobflow import OutputReference
+    from numpy.typing import NDArray
     from pymatgen.alchemy import ElementLike
     from pymatgen.analysis.structure_matcher import StructureMatcher
     from pymatgen.core import Structure
@@ -92,11 +101,14 @@ def get_stable_inserted_results(
     add_name = f"{n_inserted}"
 
     static_job = static_maker.make(structure=structure)
-    chg_job = get_charge_density_job(static_job.output.dir_name, get_charge_density)
+    # read the charge density in the insertion job itself rather than passing the
+    # full volumetric data between jobs
     insertion_job = get_inserted_structures(
-        chg_job.output,
+        None,
         inserted_species=inserted_element,
         insertions_per_step=insertions_per_step,
+        prev_dir=static_job.output.dir_name,
+        get_charge_density=get_charge_density,
     )
     relax_jobs = get_relaxed_job_summaries(
         structures=insertion_job.output, relax_maker=relax_maker, append_name=add_name
@@ -107,34 +119,30 @@ def get_stable_inserted_results(
         ref_structure=structure,
         structure_matcher=structure_matcher,
     )
+    jobs = [static_job, insertion_job, relax_jobs, min_en_job]
     nn_step = n_steps - 1 if n_steps is not None else None
-    next_step = get_stable_inserted_results(
-        structure=min_en_job.output[0],
-        inserted_element=inserted_element,
-        structure_matcher=structure_matcher,
-        static_maker=static_maker,
-        relax_maker=relax_maker,
-        get_charge_density=get_charge_density,
-        insertions_per_step=insertions_per_step,
-        n_steps=nn_step,
-        n_inserted=n_inserted + 1,
-    )
+    if nn_step == 0:
+        # the insertion budget is exhausted, no need to spawn a terminal job
+        next_entries: list[ComputedEntry] | OutputReference = []
+    else:
+        next_step = get_stable_inserted_results(
+            structure=min_en_job.output[0],
+            inserted_element=inserted_element,
+            structure_matcher=structure_matcher,
+            static_maker=static_maker,
+            relax_maker=relax_maker,
+            get_charge_density=get_charge_density,
+            insertions_per_step=insertions_per_step,
+            n_steps=nn_step,
+            n_inserted=n_inserted + 1,
+        )
+        jobs.append(next_step)
+        next_entries = next_step.output
 
-    for job_ in [static_job, chg_job, insertion_job, min_en_job, relax_jobs, next_step]:
+    for job_ in jobs:
         job_.append_name(f" {add_name}")
-    combine_job = get_computed_entries(next_step.output, min_en_job.output)
-    replace_flow = Flow(
-        jobs=[
-            static_job,
-            chg_job,
-            insertion_job,
-            relax_jobs,
-            min_en_job,
-            next_step,
-            combine_job,
-        ],
-        output=combine_job.output,
-    )
+    combine_job = get_computed_entries(next_entries, min_en_job.output)
+    replace_flow = Flow(jobs=[*jobs, combine_job], output=combine_job.output)
     return Response(replace=replace_flow)
 
 
@@ -204,28 +212,43 @@ def get_insertion_electrode_doc(
 
 @job
 def get_inserted_structures(
-    chg: VolumetricData,
+    chg: VolumetricData | None,
     inserted_species: ElementLike,
     insertions_per_step: int = 4,
     charge_insertion_generator: ChargeInterstitialGenerator | None = None,
+    *,
+    prev_dir: Path | str | None = None,
+    get_charge_density: Callable | None = None,
 ) -> list[Structure]:
     """Get the inserted structures.
 
     Parameters
     ----------
-    chg: The charge density.
+    chg: The charge density. If None, the charge density is read from `prev_dir`
+        with `get_charge_density`.
     inserted_species: The species to insert.
     insertions_per_step: The maximum number of ion insertion sites to attempt.
     charge_insertion_generator: The charge insertion generator to use,
         tolerances should be set here.
+    prev_dir: The previous directory where the static calculation was performed.
+        Only used if `chg` is None.
+    get_charge_density: A function to get the charge density from `prev_dir`.
+        Reading the charge density here avoids passing the full volumetric data
+        through the job store.
 
 
     Returns
     -------
         The inserted structures.
     """
+    if chg is None:
+        if prev_dir is None or get_charge_density is None:
+            raise ValueError(
+                "prev_dir and get_charge_density are required if chg is not given."
+            )
+        chg = get_charge_density(prev_dir)
     if charge_insertion_generator is None:
-        charge_insertion_generator = ChargeInterstitialGenerator()
+        charge_insertion_generator = _ChargeInterstitialGenerator()
     gen = charge_insertion_generator.generate(chg, insert_species=[inserted_species])
     inserted_structures = [defect.defect_structure for defect in gen]
     return inserted_structures[:insertions_per_step]
@@ -306,6 +329,10 @@ def get_charge_density_job(
 ) -> VolumetricData:
     """Get the charge density from a task document.
 
+    This job is no longer used by the ion insertion flow, which reads the charge
+    density directly in :obj:`get_inserted_structures` instead. It is kept for
+    backwards compatibility.
+
     Parameters
     ----------
     prev_dir: The previous directory where the static calculation was performed.
@@ -316,3 +343,62 @@ def get_charge_density_job(
         The charge density.
     """
     return get_charge_density(prev_dir)
+
+
+def _get_local_minima(chgcar: VolumetricData) -> NDArray:
+    """Get the fractional coordinates of the local minima in a charge density.
+
+    Equivalent to ``get_local_extrema(chgcar, find_min=True)`` from
+    pymatgen-analysis-defects, but applies a periodic minimum filter directly to
+    the grid instead of searching a 3x3x3 tiled copy of the data.
+    """
+    data = chgcar.data["total"]
+    is_min = data == minimum_filter(data, size=3, mode="wrap")
+    # the global maximum is never a minimum, this also excludes a uniform grid
+    is_min &= data < data.max()
+    indices = np.argwhere(is_min)
+    # order by increasing charge density, consistent with the peak finding order
+    indices = indices[np.argsort(data[is_min], kind="stable")]
+    return indices / data.shape
+
+
+class _ChargeInsertionAnalyzer(ChargeInsertionAnalyzer):
+    """Charge insertion analyzer using a periodic minimum filter."""
+
+    @cached_property
+    def labeled_sites(self) -> list[tuple[list[float], int]]:
+        """Get a list of inserted site positions and structure matching labels."""
+        # mirrors ChargeInsertionAnalyzer.labeled_sites in
+        # pymatgen-analysis-defects 2025.1.18, only the minima search differs
+        return get_labeled_inserted_structure(
+            sites=_get_local_minima(self.chgcar),
+            host_structure=self.chgcar.structure,
+            working_ion=self.working_ion,
+            min_dist=self.min_dist,
+            clustering_tol=self.clustering_tol,
+            sm=self.sm,
+        )
+
+
+class _ChargeInterstitialGenerator(ChargeInterstitialGenerator):
+    """Charge interstitial generator using a periodic minimum filter."""
+
+    def _get_candidate_sites(
+        self, chgcar: VolumetricData
+    ) -> Generator[tuple, None, None]:
+        # mirrors ChargeInterstitialGenerator._get_candidate_sites in
+        # pymatgen-analysis-defects 2025.1.18, only the analyzer class differs
+        cia = _ChargeInsertionAnalyzer(
+            chgcar,
+            clustering_tol=self.clustering_tol,
+            ltol=self.ltol,
+            stol=self.stol,
+            angle_tol=self.angle_tol,
+            min_dist=self.min_dist,
+        )
+        avg_chg_groups = cia.filter_and_group(
+            avg_radius=self.avg_radius,
+            max_avg_charge=self.max_avg_charge,
+        )
+        for _, group in avg_chg_groups:
+            yield min(group), len(group), group
@@ -191,7 +191,13 @@ class FormationEnergyMaker(defect_flows.FormationEnergyMaker):
         -------
         ComputedStructureEntry
         """
-        task_doc = TaskDoc.from_directory(previous_dir)
+        # only the entry and planar-averaged LOCPOT are needed, so skip parsing the
+        # other volumetric files and the density of states
+        task_doc = TaskDoc.from_directory(
+            previous_dir,
+            volumetric_files=("LOCPOT",),
+            vasprun_kwargs={"parse_dos": False, "parse_projected_eigen": False},
+        )
         return task_doc.structure_entry, task_doc.calcs_reversed[0].output.locpot
 
     def get_planar_locpot(self, task_doc: TaskDoc) -> dict:
@@ -3,11 +3,14 @@
 from __future__ import annotations
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 
 from jobflow import job
 from pymatgen.io.vasp import Incar
 from pymatgen.io.vasp.outputs import WSWQ
 
+from atomate2 import SETTINGS
 from atomate2.common.files import copy_files, gunzip_files, gzip_files, rename_files
 from atomate2.common.jobs.defect import (  # noqa: F401
     bulk_supercell_calculation,
@@ -62,17 +65,46 @@ def calculate_finite_diff(
 
     d_dir_names = [strip_hostname(d) for d in distorted_calc_dirs]
 
-    for idx, dir_name in enumerate(d_dir_names):
-        # Copy a distorted WAVECAR to WAVECAR.qqq
-        copy_files(dir_name, include_files=["WAVECAR.gz"], prefix="qqq.")
-        gunzip_files(include_files="qqq.WAVECAR*", allow_missing=True)
-        rename_files({"qqq.WAVECAR": "WAVECAR.qqq"})
+    # Custodian's scratch directory changes the working directory of the whole
+    # process while VASP runs, so only stage the next distorted WAVECAR in the
+    # background when VASP runs in place. Paths are always resolved up front, and
+    # the scratch directory is passed to run_vasp so both see the same value.
+    cwd = Path.cwd()
+    scratch_dir = run_vasp_kwargs.get("scratch_dir", SETTINGS.CUSTODIAN_SCRATCH_DIR)
+    run_vasp_kwargs = {**run_vasp_kwargs, "scratch_dir": scratch_dir}
+    prefetch = scratch_dir is None
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        staged = (
+            executor.submit(_stage_wavecar, d_dir_names[0], 0, cwd)
+            if prefetch
+            else None
+        )
+        for idx, dir_name in enumerate(d_dir_names):
+            if staged is None:
+                _stage_wavecar(dir_name, idx, cwd)
+            else:
+                staged.result()
+            rename_files({f"qqq{idx}.WAVECAR": "WAVECAR.qqq"}, directory=cwd)
+            if prefetch and idx + 1 < len(d_dir_names):
+                staged = executor.submit(
+                    _stage_wavecar, d_dir_names[idx + 1], idx + 1, cwd
+                )
 
-        run_vasp(**run_vasp_kwargs)
-        fc.copy("WSWQ", f"WSWQ.{idx}")
+            run_vasp(**run_vasp_kwargs)
+            fc.copy("WSWQ", f"WSWQ.{idx}")
 
     fd_doc = FiniteDifferenceDocument.from_directory(
         ".", ref_dir=ref_calc_dir, distorted_dirs=d_dir_names
     )
     gzip_files(".", force=True)
     return fd_doc
+
+
+def _stage_wavecar(dir_name: str, idx: int, dest_dir: Path) -> None:
+    """Copy and decompress a distorted WAVECAR to ``dest_dir/qqq{idx}.WAVECAR``."""
+    copy_files(
+        dir_name, dest_dir=dest_dir, include_files=["WAVECAR.gz"], prefix=f"qqq{idx}."
+    )
+    gunzip_files(
+        directory=dest_dir, include_files=f"qqq{idx}.WAVECAR*", allow_missing=True
+    )
@@ -0,0 +1,14 @@
+from atomate2.common.jobs.defect import _cached_sc_fromstruct, _get_sc_fromstruct
+
+
+def test_get_sc_fromstruct_cache(si_structure):
+    _cached_sc_fromstruct.cache_clear()
+    sc_mat = _get_sc_fromstruct(si_structure)
+    expected = sc_mat.copy()
+    assert _cached_sc_fromstruct.cache_info().hits == 0
+
+    # modifying the returned matrix must not change the cached result
+    sc_mat[0, 0] += 1
+    sc_mat2 = _get_sc_fromstruct(si_structure)
+    assert _cached_sc_fromstruct.cache_info().hits == 1
+    assert (sc_mat2 == expected).all()
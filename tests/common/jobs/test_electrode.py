@@ -0,0 +1,19 @@
+import numpy as np
+import pytest
+from pymatgen.analysis.defects.utils import get_local_extrema
+from pymatgen.io.vasp import Chgcar
+
+from atomate2.common.jobs.electrode import _get_local_minima
+
+
+@pytest.mark.parametrize("static_dir", ["static_0", "static_1"])
+def test_get_local_minima(test_dir, static_dir):
+    outputs = test_dir / "vasp" / "H_Graphite" / static_dir / "outputs"
+    aeccar0 = Chgcar.from_file(outputs / "AECCAR0.gz")
+    aeccar2 = Chgcar.from_file(outputs / "AECCAR2.gz")
+    chgcar = aeccar0.linear_add(aeccar2)
+
+    minima = _get_local_minima(chgcar)
+    expected = get_local_extrema(chgcar, find_min=True)
+    assert len(minima) > 0
+    assert np.allclose(minima, expected)
@@ -1,6 +1,7 @@
 from typing import TYPE_CHECKING
 
 import numpy as np
+import pytest
 from jobflow import JobStore, run_locally
 from maggma.stores.mongolike import MemoryStore
 from pymatgen.analysis.defects.generators import SubstitutionGenerator
@@ -64,7 +65,15 @@ def test_ccd_maker(mock_vasp, clean_dir, test_dir):
     assert ccd.relaxed_index2 == 2
 
 
-def test_nonrad_maker(mock_vasp, clean_dir, test_dir, monkeypatch):
+@pytest.mark.parametrize("scratch_dir", [None, "scratch"])
+def test_nonrad_maker(mock_vasp, clean_dir, test_dir, monkeypatch, scratch_dir):
+    # with a custodian scratch dir the distorted WAVECARs are staged sequentially;
+    # the mocked VASP run ignores scratch_dir, so this only covers the sequential
+    # staging path and not running VASP from a scratch directory
+    monkeypatch.setattr(
+        "atomate2.vasp.jobs.defect.SETTINGS.CUSTODIAN_SCRATCH_DIR", scratch_dir
+    )
+
     # mapping from job name to directory containing test files
     ref_paths = {
         "relax q1": "Si_config_coord/relax_q1",
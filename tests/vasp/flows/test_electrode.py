@@ -1,20 +1,17 @@
 from __future__ import annotations
 
+from emmet.core.electrode import InsertionElectrodeDoc
+from jobflow import OutputReference, run_locally
+from monty.serialization import loadfn
+from pymatgen.core import Structure
+from pymatgen.io.vasp.sets import MPScanRelaxSet, MPScanStaticSet
 
-def test_electrode_makers(mock_vasp, clean_dir, test_dir):
-    from emmet.core.electrode import InsertionElectrodeDoc
-    from jobflow import OutputReference, run_locally
-    from monty.serialization import loadfn
-    from pymatgen.core import Structure
-    from pymatgen.io.vasp.sets import MPScanRelaxSet, MPScanStaticSet
+from atomate2.vasp.flows.core import RelaxMaker, StaticMaker
+from atomate2.vasp.flows.electrode import ElectrodeInsertionMaker
+from atomate2.vasp.powerups import update_vasp_input_generators
 
-    from atomate2.vasp.flows.core import RelaxMaker, StaticMaker
-    from atomate2.vasp.flows.electrode import ElectrodeInsertionMaker
-    from atomate2.vasp.powerups import (
-        update_user_incar_settings,
-        update_user_kpoints_settings,
-    )
 
+def test_electrode_makers(mock_vasp, clean_dir, test_dir):
     # mapping from job name to directory containing test files
     ref_paths = {
         "relax": "H_Graphite/relax",
@@ -57,9 +54,17 @@ def test_electrode_makers(mock_vasp, clean_dir, test_dir):
         struct, inserted_element="H", n_steps=2, working_ion_entry=h_entry
     )
 
-    flow = update_user_kpoints_settings(flow, {"grid_density": 88})
-    flow = update_user_incar_settings(
-        flow, {"NGX": 18, "NGY": 18, "NGZ": 60, "ISIF": 2, "EDIFFG": -0.1}
+    # apply the k-point and INCAR settings in a single pass over the flow
+    flow = update_vasp_input_generators(
+        flow,
+        {
+            "input_set_generator->user_kpoints_settings->grid_density": 88,
+            "input_set_generator->user_incar_settings->NGX": 18,
+            "input_set_generator->user_incar_settings->NGY": 18,
+            "input_set_generator->user_incar_settings->NGZ": 60,
+            "input_set_generator->user_incar_settings->ISIF": 2,
+            "input_set_generator->user_incar_settings->EDIFFG": -0.1,
+        },
     )
 
     # run the flow or job and ensure that it finished running successfully
@@ -67,20 +72,16 @@ def test_electrode_makers(mock_vasp, clean_dir, test_dir):
         flow, create_folders=True, ensure_success=True, raise_immediately=True
     )
 
-    inserted_formulas = []
-    ie_doc = None
-    for res in responses.values():
-        for r in res.values():
-            if not isinstance(r.output, OutputReference) and hasattr(
-                r.output, "formula_pretty"
-            ):
-                inserted_formulas.append(
-                    f"{r.output.formula_pretty}-{r.output.task_label.split()[0]}"
-                )
-            if isinstance(r.output, InsertionElectrodeDoc):
-                ie_doc = r.output
-
-    inserted_formulas.sort()
+    outputs = [r.output for res in responses.values() for r in res.values()]
+    inserted_formulas = sorted(
+        f"{output.formula_pretty}-{output.task_label.partition(' ')[0]}"
+        for output in outputs
+        if not isinstance(output, OutputReference) and hasattr(output, "formula_pretty")
+    )
+    ie_doc = next(
+        (output for output in outputs if isinstance(output, InsertionElectrodeDoc)),
+        None,
+    )
 
     # C-relax, C-static
     # HC4-relax (1x first insertion)